@@ -10,6 +10,7 @@ import (
 	"fontget/internal/cmdutils"
 	"fontget/internal/components"
 	"fontget/internal/installations"
+	"fontget/internal/normalize"
 	"fontget/internal/output"
 	"fontget/internal/platform"
 	"fontget/internal/repo"
@@ -1561,15 +1562,11 @@ func checkFontsAlreadyInstalled(fontID string, fontName string, scope platform.I
 	// but it's acceptable as a fallback for fonts not in the repository
 	if fontName != "" {
 		fontNameLower := strings.ToLower(fontName)
-		fontNameNorm := strings.ReplaceAll(fontNameLower, " ", "")
-		fontNameNorm = strings.ReplaceAll(fontNameNorm, "-", "")
-		fontNameNorm = strings.ReplaceAll(fontNameNorm, "_", "")
+		fontNameNorm := normalize.FontKey(fontName)
 
 		for familyName := range families {
 			familyLower := strings.ToLower(familyName)
-			familyNorm := strings.ReplaceAll(familyLower, " ", "")
-			familyNorm = strings.ReplaceAll(familyNorm, "-", "")
-			familyNorm = strings.ReplaceAll(familyNorm, "_", "")
+			familyNorm := normalize.FontKey(familyName)
 
 			// Check for exact match (normalized)
 			if familyLower == fontNameLower || familyNorm == fontNameNorm {
@@ -434,7 +434,7 @@ func createBackupZipArchive(sourceFamilyMap map[string]map[string][]fontFileInfo
 		}
 
 		// Attempt to clean up temp file with retry logic
-		// Small delay to allow OS to release file handle (Windows file locking)
+		// Retries back off to allow OS to release file handle (Windows file locking)
 		// This helps prevent "file in use" errors on Windows, especially on cancellation
 		if tempPath != "" {
 			removeTempFileWithRetry(tempPath)
@@ -662,11 +662,10 @@ func removeTempFileWithRetry(tempPath string) {
 	const initialDelay = 100 * time.Millisecond
 
 	for i := 0; i < maxRetries; i++ {
-		// Delay before attempting removal (longer delay on first attempt for active writes)
+		// Try immediately; only back off before retries. The common cases (temp file already
+		// renamed into place, or a stale leftover from an earlier run) need no delay at all.
 		if i > 0 {
 			time.Sleep(initialDelay * time.Duration(i))
-		} else {
-			time.Sleep(initialDelay)
 		}
 
 		err := os.Remove(tempPath)
@@ -437,7 +437,7 @@ func removeFontFiles(params RemoveFontFilesParams) (removed, skipped, failed int
 			failed++
 			var errorMsg string
 			errStr := err.Error()
-			if containsAny(errStr, []string{"in use", "access denied", "permission"}) {
+			if containsAny(errStr, removeAccessErrorHints) {
 				errorMsg = "Font is in use or access denied"
 			} else {
 				errorMsg = "Failed to remove existing font"
@@ -973,10 +973,15 @@ func setupRemovalOperationItems(
 	return operationItems, fontScopeItems, nil
 }
 
-// containsAny checks if a string contains any of the given substrings (case-insensitive)
+// removeAccessErrorHints are lowercase fragments of RemoveFont errors caused by a locked or protected file
+var removeAccessErrorHints = []string{"in use", "access denied", "permission"}
+
+// containsAny checks if a string contains any of the given substrings (case-insensitive).
+// Substrings must already be lowercase; s is lowercased once rather than once per substring.
 func containsAny(s string, substrings []string) bool {
+	lower := strings.ToLower(s)
 	for _, substr := range substrings {
-		if strings.Contains(strings.ToLower(s), strings.ToLower(substr)) {
+		if strings.Contains(lower, substr) {
 			return true
 		}
 	}
@@ -76,7 +76,7 @@ var sourcesInfoCmd = &cobra.Command{
 
 		if err == nil {
 			sourcesDir := filepath.Join(home, ".fontget", "sources")
-			if entries, err := os.ReadDir(sourcesDir); err != nil || len(entries) == 0 {
+			if entries, err := os.ReadDir(sourcesDir); err != nil || countSourceFiles(entries) == 0 {
 				// No source files exist, force refresh with spinner
 				if logger != nil {
 					logger.Info("No source files found, forcing refresh with spinner")
@@ -465,8 +465,7 @@ func runSourcesUpdateVerbose() error {
 		}
 
 		// Validate JSON
-		var jsonData interface{}
-		if err := json.Unmarshal(body, &jsonData); err != nil {
+		if err := validateJSON(body); err != nil {
 			fmt.Printf("%s\n", ui.RenderError(fmt.Sprintf("Source content is not valid JSON - %v", err)))
 			fmt.Println()
 			logSourcesUpdateCLIStep(sourceName, source.URL, fmt.Errorf("invalid JSON: %w", err))
@@ -641,6 +640,18 @@ func init() {
 	sourcesUpdateCmd.Flags().BoolP("verbose", "v", false, "Show detailed error messages for failed sources")
 }
 
+// countSourceFiles counts the .json source files among entries, ignoring leftovers such as
+// temporary files from an interrupted cache write
+func countSourceFiles(entries []os.DirEntry) int {
+	count := 0
+	for _, entry := range entries {
+		if !entry.IsDir() && strings.HasSuffix(entry.Name(), ".json") {
+			count++
+		}
+	}
+	return count
+}
+
 // Helper functions for sources validate
 
 func isValidSourceFile(filePath string) bool {
@@ -649,8 +660,17 @@ func isValidSourceFile(filePath string) bool {
 		return false
 	}
 
-	var jsonData interface{}
-	return json.Unmarshal(data, &jsonData) == nil
+	return json.Valid(data)
+}
+
+// validateJSON returns nil if data is well-formed JSON. json.Valid scans the input without
+// building a value tree; only on failure is it decoded again to recover the syntax error.
+func validateJSON(data []byte) error {
+	if json.Valid(data) {
+		return nil
+	}
+	var raw json.RawMessage
+	return json.Unmarshal(data, &raw)
 }
 
 // formatFileSize formats cache/directory sizes for sources output (KMGTPE). See shared.FormatFileSize for the narrower KB/MB helper used elsewhere.
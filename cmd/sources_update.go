@@ -2,7 +2,6 @@ package cmd
 
 import (
 	"context"
-	"encoding/json"
 	"fmt"
 	"io"
 	"net/http"
@@ -12,6 +11,7 @@ import (
 
 	"fontget/internal/config"
 	"fontget/internal/functions"
+	"fontget/internal/network"
 	"fontget/internal/output"
 	"fontget/internal/repo"
 	"fontget/internal/ui"
@@ -62,13 +62,8 @@ func createHTTPClient() *http.Client {
 	generalTimeout := config.ParseDuration(appConfig.Network.RequestTimeout, 10*time.Second)
 
 	return &http.Client{
-		Timeout: generalTimeout,
-		Transport: &http.Transport{
-			ResponseHeaderTimeout: 5 * time.Second,  // Keep internal transport timeout
-			IdleConnTimeout:       30 * time.Second, // Keep internal transport timeout
-			MaxIdleConns:          10,
-			MaxIdleConnsPerHost:   2,
-		},
+		Timeout:   generalTimeout,
+		Transport: network.NewSourceTransport(5 * time.Second), // Keep internal transport timeout
 	}
 }
 
@@ -325,8 +320,7 @@ func (m updateModel) updateNextSource() tea.Cmd {
 		}
 
 		// Validate that it's valid JSON
-		var jsonData interface{}
-		if err := json.Unmarshal(body, &jsonData); err != nil {
+		if err := validateJSON(body); err != nil {
 			return updateCompleteMsg{
 				source: source,
 				status: "Failed",
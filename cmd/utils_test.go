@@ -465,3 +465,25 @@ func TestCloneDownloadOptsForProgress_nilIncoming(t *testing.T) {
 		t.Fatal("expected nil OnResponseHeaders")
 	}
 }
+
+func TestValidateJSON(t *testing.T) {
+	tests := []struct {
+		name    string
+		data    string
+		wantErr bool
+	}{
+		{name: "object", data: `{"source_info": {"name": "Test"}, "fonts": {}}`, wantErr: false},
+		{name: "array", data: `[1, 2, 3]`, wantErr: false},
+		{name: "truncated", data: `{"fonts": {`, wantErr: true},
+		{name: "empty", data: ``, wantErr: true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			err := validateJSON([]byte(tt.data))
+			if (err != nil) != tt.wantErr {
+				t.Errorf("validateJSON(%q) error = %v, wantErr %v", tt.data, err, tt.wantErr)
+			}
+		})
+	}
+}
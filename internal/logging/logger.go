@@ -48,6 +48,9 @@ type Logger struct {
 	lastRotation  time.Time
 	rotationCount int
 	ConsoleOutput bool
+	// tsSecond/tsText cache the formatted entry timestamp; it only changes once per second.
+	tsSecond      int64
+	tsText        string
 }
 
 // Config holds the configuration for the logger
@@ -250,7 +253,7 @@ func (l *Logger) log(level LogLevel, format string, args ...interface{}) {
 
 	// Format the log message
 	msg := fmt.Sprintf(format, args...)
-	timestamp := time.Now().Format("2006-01-02 15:04:05")
+	timestamp := l.timestamp(time.Now())
 	logEntry := fmt.Sprintf("[%s] %s: %s\n", timestamp, levelNames[level], msg)
 
 	// Write the log entry
@@ -267,6 +270,16 @@ func (l *Logger) log(level LogLevel, format string, args ...interface{}) {
 	}
 }
 
+// timestamp returns now formatted for a log entry, reusing the previous result within the same
+// second so bursts of log lines don't each pay for time.Format. Callers must hold l.mu.
+func (l *Logger) timestamp(now time.Time) string {
+	if sec := now.Unix(); sec != l.tsSecond || l.tsText == "" {
+		l.tsSecond = sec
+		l.tsText = now.Format("2006-01-02 15:04:05")
+	}
+	return l.tsText
+}
+
 // rotate rotates the log file
 func (l *Logger) rotate() error {
 	// Close the current file
@@ -9,6 +9,18 @@ import (
 	"time"
 )
 
+// NewSourceTransport returns a transport for fetching source manifests. It starts from
+// http.DefaultTransport so proxy settings, dial/TLS timeouts, HTTP/2 and gzip carry over, and
+// keeps a small idle pool since source files come from a handful of hosts.
+func NewSourceTransport(headerTimeout time.Duration) *http.Transport {
+	tr := http.DefaultTransport.(*http.Transport).Clone()
+	tr.ResponseHeaderTimeout = headerTimeout
+	tr.IdleConnTimeout = 30 * time.Second
+	tr.MaxIdleConns = 10
+	tr.MaxIdleConnsPerHost = 2
+	return tr
+}
+
 // NewDownloadHTTPClient returns an http.Client suitable for large/binary downloads.
 // It uses a cookie jar so redirects that set cookies behave closer to browsers.
 func NewDownloadHTTPClient(headerTimeout time.Duration, forceHTTP1 bool, onRedirect func(from *url.URL, to *url.URL, viaCount int)) *http.Client {
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"io"
 	"sync"
+	"sync/atomic"
 	"time"
 )
 
@@ -18,10 +19,7 @@ type StallDetectingReader struct {
 	inactivityTimeout time.Duration
 	overallTimeout    time.Duration
 	startTime         time.Time
-	lastActivity      time.Time
-	lastActivityMutex sync.RWMutex
-	bytesRead         int64
-	bytesReadMutex    sync.RWMutex
+	bytesRead         atomic.Int64
 	err               error
 	errMutex          sync.RWMutex
 }
@@ -49,7 +47,6 @@ func NewStallDetectingReader(reader io.Reader, inactivityTimeout, overallTimeout
 		inactivityTimeout: inactivityTimeout,
 		overallTimeout:    overallTimeout,
 		startTime:         time.Now(),
-		lastActivity:      time.Now(),
 	}
 
 	// Start monitoring goroutine
@@ -59,7 +56,8 @@ func NewStallDetectingReader(reader io.Reader, inactivityTimeout, overallTimeout
 }
 
 // Read implements io.Reader interface.
-// It reads from the underlying reader and updates the last activity time on each successful read.
+// It reads from the underlying reader and counts the bytes transferred. Activity is inferred by the
+// monitor from that counter, so the per-read cost is a single atomic add (no clock read or lock).
 func (r *StallDetectingReader) Read(p []byte) (int, error) {
 	// Check if already canceled
 	if r.ctx.Err() != nil {
@@ -76,15 +74,8 @@ func (r *StallDetectingReader) Read(p []byte) (int, error) {
 	n, err := r.reader.Read(p)
 
 	if n > 0 {
-		// Update activity tracking
-		r.lastActivityMutex.Lock()
-		r.lastActivity = time.Now()
-		r.lastActivityMutex.Unlock()
-
-		// Update bytes read counter
-		r.bytesReadMutex.Lock()
-		r.bytesRead += int64(n)
-		r.bytesReadMutex.Unlock()
+		// Update bytes read counter (doubles as the activity signal for monitor)
+		r.bytesRead.Add(int64(n))
 	}
 
 	// If we hit EOF or an error, store it
@@ -99,16 +90,21 @@ func (r *StallDetectingReader) Read(p []byte) (int, error) {
 
 // monitor runs in a goroutine and periodically checks for timeouts.
 // It cancels the context if either the inactivity timeout or overall timeout is exceeded.
+// Activity is sampled once per tick: if the byte counter moved since the last tick, the
+// transfer is considered active as of that tick.
 func (r *StallDetectingReader) monitor() {
 	ticker := time.NewTicker(1 * time.Second)
 	defer ticker.Stop()
 
+	lastActivity := r.startTime
+	var lastBytes int64
+
 	for {
 		select {
 		case <-r.ctx.Done():
 			// Already canceled, exit
 			return
-		case <-ticker.C:
+		case now := <-ticker.C:
 			// Check overall timeout (safety net only - should be very long or disabled)
 			if r.overallTimeout > 0 && time.Since(r.startTime) > r.overallTimeout {
 				r.errMutex.Lock()
@@ -119,9 +115,11 @@ func (r *StallDetectingReader) monitor() {
 			}
 
 			// Check inactivity timeout
-			r.lastActivityMutex.RLock()
-			elapsed := time.Since(r.lastActivity)
-			r.lastActivityMutex.RUnlock()
+			if bytes := r.bytesRead.Load(); bytes != lastBytes {
+				lastBytes = bytes
+				lastActivity = now
+			}
+			elapsed := now.Sub(lastActivity)
 
 			if elapsed > r.inactivityTimeout {
 				r.errMutex.Lock()
@@ -148,9 +146,7 @@ func (r *StallDetectingReader) Close() error {
 
 // BytesRead returns the total number of bytes read so far.
 func (r *StallDetectingReader) BytesRead() int64 {
-	r.bytesReadMutex.RLock()
-	defer r.bytesReadMutex.RUnlock()
-	return r.bytesRead
+	return r.bytesRead.Load()
 }
 
 // StallError represents an error when download activity stalls.
@@ -0,0 +1,48 @@
+package network
+
+import (
+	"errors"
+	"io"
+	"strings"
+	"testing"
+	"time"
+)
+
+func TestStallDetectingReader_CountsBytes(t *testing.T) {
+	r := NewStallDetectingReader(strings.NewReader("hello, world"), time.Minute, 0)
+	defer r.Close()
+
+	data, err := io.ReadAll(r)
+	if err != nil {
+		t.Fatalf("ReadAll: %v", err)
+	}
+	if string(data) != "hello, world" {
+		t.Fatalf("data = %q", data)
+	}
+	if got := r.BytesRead(); got != int64(len(data)) {
+		t.Fatalf("BytesRead = %d, want %d", got, len(data))
+	}
+}
+
+func TestStallDetectingReader_StallCancels(t *testing.T) {
+	pr, pw := io.Pipe()
+	defer pw.Close()
+
+	r := NewStallDetectingReader(pr, 10*time.Millisecond, 0)
+	defer r.Close()
+
+	// No data is ever written; the monitor should flag a stall on its first tick.
+	deadline := time.Now().Add(3 * time.Second)
+	for r.ctx.Err() == nil {
+		if time.Now().After(deadline) {
+			t.Fatal("reader was not canceled after stalling")
+		}
+		time.Sleep(50 * time.Millisecond)
+	}
+
+	_, err := r.Read(make([]byte, 1))
+	var stallErr *StallError
+	if !errors.As(err, &stallErr) {
+		t.Fatalf("Read error = %v, want *StallError", err)
+	}
+}
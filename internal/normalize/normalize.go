@@ -1,15 +1,23 @@
 package normalize
 
-import "strings"
+import (
+	"strings"
+	"unicode"
+)
 
 // FontKey normalizes a font family/name string for stable comparisons.
-// It lowercases and removes common separators (spaces, hyphens, underscores).
+// It lowercases and removes common separators (spaces, hyphens, underscores) in a single
+// pass, allocating at most one new string (none if s is already normalized).
 func FontKey(s string) string {
-	s = strings.ToLower(s)
-	s = strings.ReplaceAll(s, " ", "")
-	s = strings.ReplaceAll(s, "-", "")
-	s = strings.ReplaceAll(s, "_", "")
-	return s
+	return strings.Map(fontKeyRune, s)
+}
+
+func fontKeyRune(r rune) rune {
+	switch r {
+	case ' ', '-', '_':
+		return -1
+	}
+	return unicode.ToLower(r)
 }
 
 // BaseFamilyName removes common suffix patterns from an installed font family name so it can
@@ -0,0 +1,21 @@
+package normalize
+
+import "testing"
+
+func TestFontKey(t *testing.T) {
+	tests := []struct {
+		in   string
+		want string
+	}{
+		{"Open Sans", "opensans"},
+		{"JetBrains-Mono_NL", "jetbrainsmononl"},
+		{"roboto", "roboto"},
+		{"", ""},
+		{"Noto Sans Ölçek", "notosansölçek"},
+	}
+	for _, tt := range tests {
+		if got := FontKey(tt.in); got != tt.want {
+			t.Errorf("FontKey(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
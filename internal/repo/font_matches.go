@@ -80,13 +80,9 @@ func buildFontIndex(manifest *FontManifest) *fontIndex {
 			index.byName[normalizedName] = append(index.byName[normalizedName], entry)
 
 			// Index by font ID name (without prefix)
-			if strings.Contains(fontID, ".") {
-				idParts := strings.Split(fontID, ".")
-				if len(idParts) > 1 {
-					idName := strings.Join(idParts[1:], ".")
-					normalizedIDName := normalize.FontKey(idName)
-					index.byIDName[normalizedIDName] = append(index.byIDName[normalizedIDName], entry)
-				}
+			if _, idName, found := strings.Cut(fontID, "."); found {
+				normalizedIDName := normalize.FontKey(idName)
+				index.byIDName[normalizedIDName] = append(index.byIDName[normalizedIDName], entry)
 			} else {
 				// Font ID without prefix
 				normalizedFontID := normalize.FontKey(fontID)
@@ -369,7 +365,7 @@ func IsFontIDInCachedManifest(fontID string) bool {
 // lookupFontByIDInManifest resolves font ID across sources using getSourcesInPriorityOrder:
 // higher-priority sources (lower priority number) win when duplicate IDs exist across sources.
 func lookupFontByIDInManifest(manifest *FontManifest, fontID string) (canonicalID string, font FontInfo, sourceName string, ok bool) {
-	want := strings.ToLower(strings.TrimSpace(fontID))
+	want := strings.TrimSpace(fontID)
 	if manifest == nil || manifest.Sources == nil || want == "" {
 		return "", FontInfo{}, "", false
 	}
@@ -378,8 +374,12 @@ func lookupFontByIDInManifest(manifest *FontManifest, fontID string) (canonicalI
 		if !exists || source.Fonts == nil {
 			continue
 		}
+		// Manifest IDs are already canonical, so an exact key hit is the common case
+		if f, found := source.Fonts[want]; found {
+			return want, f, sn, true
+		}
 		for id, f := range source.Fonts {
-			if strings.ToLower(strings.TrimSpace(id)) != want {
+			if !strings.EqualFold(strings.TrimSpace(id), want) {
 				continue
 			}
 			return id, f, sn, true
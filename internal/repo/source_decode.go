@@ -0,0 +1,113 @@
+package repo
+
+import (
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+	"strings"
+)
+
+// decodeSourceData decodes a FontGet-Sources document one font entry at a time.
+// json.Decoder.Decode on the whole document buffers the entire payload before decoding it;
+// walking the "fonts" object with Token/More keeps only the current entry buffered, so peak
+// memory is the decoded fonts map rather than the map plus the raw JSON. Like json.Unmarshal,
+// top-level keys match case-insensitively and anything after the document is an error.
+func decodeSourceData(r io.Reader) (*SourceData, error) {
+	dec := json.NewDecoder(r)
+	if err := expectJSONDelim(dec, '{'); err != nil {
+		return nil, err
+	}
+
+	var sourceData SourceData
+	for dec.More() {
+		tok, err := dec.Token()
+		if err != nil {
+			return nil, err
+		}
+		key, _ := tok.(string)
+		switch {
+		case strings.EqualFold(key, "source_info"):
+			if err := dec.Decode(&sourceData.SourceInfo); err != nil {
+				return nil, fmt.Errorf("source_info: %w", err)
+			}
+		case strings.EqualFold(key, "fonts"):
+			if err := decodeSourceFonts(dec, &sourceData); err != nil {
+				return nil, fmt.Errorf("fonts: %w", err)
+			}
+		default:
+			// Unknown top-level field: skip its value
+			var skip json.RawMessage
+			if err := dec.Decode(&skip); err != nil {
+				return nil, err
+			}
+		}
+	}
+
+	if err := expectJSONDelim(dec, '}'); err != nil {
+		return nil, err
+	}
+	if tok, err := dec.Token(); err != io.EOF {
+		if err != nil {
+			return nil, err
+		}
+		return nil, fmt.Errorf("unexpected data after top-level value: %v", tok)
+	}
+	return &sourceData, nil
+}
+
+// decodeSourceFonts decodes the "fonts" object entry by entry into sourceData.Fonts.
+// A null value leaves Fonts nil, matching json.Unmarshal.
+func decodeSourceFonts(dec *json.Decoder, sourceData *SourceData) error {
+	tok, err := dec.Token()
+	if err != nil {
+		return err
+	}
+	if tok == nil {
+		return nil
+	}
+	if delim, ok := tok.(json.Delim); !ok || delim != '{' {
+		return fmt.Errorf("expected object, got %v", tok)
+	}
+
+	if sourceData.Fonts == nil {
+		sourceData.Fonts = make(map[string]Font)
+	}
+	for dec.More() {
+		keyTok, err := dec.Token()
+		if err != nil {
+			return err
+		}
+		fontID, _ := keyTok.(string)
+		var font Font
+		if err := dec.Decode(&font); err != nil {
+			return fmt.Errorf("%s: %w", fontID, err)
+		}
+		sourceData.Fonts[fontID] = font
+	}
+
+	return expectJSONDelim(dec, '}')
+}
+
+// expectJSONDelim reads the next token and checks that it is the given delimiter
+func expectJSONDelim(dec *json.Decoder, want json.Delim) error {
+	tok, err := dec.Token()
+	if err != nil {
+		return err
+	}
+	if delim, ok := tok.(json.Delim); !ok || delim != want {
+		return fmt.Errorf("expected %q, got %v", want, tok)
+	}
+	return nil
+}
+
+// readSourceDataFile decodes a cached FontGet-Sources file from disk without reading it into memory first
+func readSourceDataFile(path string) (*SourceData, error) {
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, err
+	}
+	defer f.Close()
+
+	return decodeSourceData(f)
+}
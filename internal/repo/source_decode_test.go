@@ -0,0 +1,76 @@
+package repo
+
+import (
+	"encoding/json"
+	"reflect"
+	"strings"
+	"testing"
+)
+
+func TestDecodeSourceData_MatchesUnmarshal(t *testing.T) {
+	doc := `{
+  "source_info": {"name": "Test Source", "version": "1.0", "last_updated": "2025-01-02T03:04:05Z", "total_fonts": 2},
+  "extra": {"ignored": [1, 2, {"x": null}]},
+  "fonts": {
+    "roboto": {"name": "Roboto", "family": "Roboto", "license": "OFL", "categories": ["Sans Serif"],
+      "variants": [{"name": "regular", "weight": 400, "style": "normal", "files": {"ttf": "https://example.com/r.ttf"}}]},
+    "fira-code": {"name": "Fira Code", "family": "Fira Code", "license": "OFL", "variants": []}
+  }
+}`
+
+	got, err := decodeSourceData(strings.NewReader(doc))
+	if err != nil {
+		t.Fatalf("decodeSourceData: %v", err)
+	}
+	var want SourceData
+	if err := json.Unmarshal([]byte(doc), &want); err != nil {
+		t.Fatalf("json.Unmarshal: %v", err)
+	}
+	if !reflect.DeepEqual(*got, want) {
+		t.Fatalf("decodeSourceData mismatch:\n got  %+v\n want %+v", *got, want)
+	}
+}
+
+func TestDecodeSourceData_KeysCaseInsensitive(t *testing.T) {
+	doc := `{"Source_Info": {"name": "Mixed Case"}, "FONTS": {"roboto": {"name": "Roboto"}}}`
+
+	got, err := decodeSourceData(strings.NewReader(doc))
+	if err != nil {
+		t.Fatalf("decodeSourceData: %v", err)
+	}
+	var want SourceData
+	if err := json.Unmarshal([]byte(doc), &want); err != nil {
+		t.Fatalf("json.Unmarshal: %v", err)
+	}
+	if !reflect.DeepEqual(*got, want) {
+		t.Fatalf("decodeSourceData mismatch:\n got  %+v\n want %+v", *got, want)
+	}
+}
+
+func TestDecodeSourceData_NullFonts(t *testing.T) {
+	got, err := decodeSourceData(strings.NewReader(`{"source_info": {"name": "Empty"}, "fonts": null}`))
+	if err != nil {
+		t.Fatalf("decodeSourceData: %v", err)
+	}
+	if got.Fonts != nil {
+		t.Fatalf("expected nil fonts map, got %v", got.Fonts)
+	}
+	if got.SourceInfo.Name != "Empty" {
+		t.Fatalf("source_info name: got %q", got.SourceInfo.Name)
+	}
+}
+
+func TestDecodeSourceData_Invalid(t *testing.T) {
+	for _, doc := range []string{
+		``,
+		`[]`,
+		`{"fonts": []}`,
+		`{"fonts": {"roboto": {"name": "Roboto"`,
+		`{"fonts": {}} garbage`,
+		`{"fonts": {}} {}`,
+	} {
+		if _, err := decodeSourceData(strings.NewReader(doc)); err == nil {
+			t.Errorf("decodeSourceData(%q): expected error", doc)
+		}
+	}
+}
@@ -0,0 +1,106 @@
+package repo
+
+import (
+	"bufio"
+	"encoding/json"
+	"io"
+	"os"
+	"path/filepath"
+	"sort"
+	"time"
+)
+
+// encodeSourceData writes a FontGet-Sources document one font entry at a time.
+// json.Marshal on the whole document builds the complete encoding in memory before it can be
+// written; encoding entry by entry keeps only the current font's bytes alive. Output is
+// equivalent to json.Marshal (compact, font IDs in sorted order).
+func encodeSourceData(w io.Writer, sourceData *SourceData) error {
+	bw := bufio.NewWriter(w)
+
+	info, err := json.Marshal(sourceData.SourceInfo)
+	if err != nil {
+		return err
+	}
+	bw.WriteString(`{"source_info":`)
+	bw.Write(info)
+	bw.WriteString(`,"fonts":`)
+
+	if sourceData.Fonts == nil {
+		bw.WriteString("null")
+	} else {
+		fontIDs := make([]string, 0, len(sourceData.Fonts))
+		for fontID := range sourceData.Fonts {
+			fontIDs = append(fontIDs, fontID)
+		}
+		sort.Strings(fontIDs)
+
+		bw.WriteByte('{')
+		for i, fontID := range fontIDs {
+			key, err := json.Marshal(fontID)
+			if err != nil {
+				return err
+			}
+			font, err := json.Marshal(sourceData.Fonts[fontID])
+			if err != nil {
+				return err
+			}
+			if i > 0 {
+				bw.WriteByte(',')
+			}
+			bw.Write(key)
+			bw.WriteByte(':')
+			bw.Write(font)
+		}
+		bw.WriteByte('}')
+	}
+	bw.WriteByte('}')
+
+	// bufio.Writer latches the first write error and reports it here
+	return bw.Flush()
+}
+
+// staleTempFileAge is how old a leftover temporary cache file must be before it is removed;
+// younger files may belong to a write still in progress in another process
+const staleTempFileAge = time.Minute
+
+// writeSourceDataFile streams sourceData to path via a temporary file in the same directory,
+// so a failed or interrupted write never leaves a truncated cache file behind.
+func writeSourceDataFile(path string, sourceData *SourceData) error {
+	tmpPattern := filepath.Base(path) + ".tmp-*"
+	removeStaleTempFiles(filepath.Join(filepath.Dir(path), tmpPattern))
+
+	tmp, err := os.CreateTemp(filepath.Dir(path), tmpPattern)
+	if err != nil {
+		return err
+	}
+	tmpPath := tmp.Name()
+
+	if err := encodeSourceData(tmp, sourceData); err != nil {
+		tmp.Close()
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := tmp.Close(); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := os.Rename(tmpPath, path); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	return nil
+}
+
+// removeStaleTempFiles deletes temporary cache files matching pattern that were left behind by
+// a process killed mid-write
+func removeStaleTempFiles(pattern string) {
+	matches, err := filepath.Glob(pattern)
+	if err != nil {
+		return
+	}
+	for _, match := range matches {
+		if info, err := os.Stat(match); err == nil && time.Since(info.ModTime()) > staleTempFileAge {
+			os.Remove(match)
+		}
+	}
+}
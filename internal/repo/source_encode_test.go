@@ -0,0 +1,110 @@
+package repo
+
+import (
+	"bytes"
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+func TestEncodeSourceData_MatchesMarshal(t *testing.T) {
+	sourceData := &SourceData{
+		SourceInfo: SourceInfo{
+			Name:        "Test Source",
+			Version:     "1.0",
+			LastUpdated: time.Date(2025, 1, 2, 3, 4, 5, 0, time.UTC),
+			TotalFonts:  2,
+		},
+		Fonts: map[string]Font{
+			"roboto": {Name: "Roboto", License: "OFL", Variants: []FontVariant{
+				{Name: "regular", Weight: 400, Style: "normal", Files: map[string]string{"ttf": "https://example.com/r.ttf?a=1&b=<2>"}},
+			}},
+			"fira-code": {Name: "Fira Code", License: "OFL"},
+		},
+	}
+
+	for _, tc := range []struct {
+		name string
+		data *SourceData
+	}{
+		{name: "fonts", data: sourceData},
+		{name: "nil fonts", data: &SourceData{SourceInfo: sourceData.SourceInfo}},
+	} {
+		t.Run(tc.name, func(t *testing.T) {
+			var buf bytes.Buffer
+			if err := encodeSourceData(&buf, tc.data); err != nil {
+				t.Fatalf("encodeSourceData: %v", err)
+			}
+			want, err := json.Marshal(tc.data)
+			if err != nil {
+				t.Fatalf("json.Marshal: %v", err)
+			}
+			if !bytes.Equal(buf.Bytes(), want) {
+				t.Fatalf("encodeSourceData mismatch:\n got  %s\n want %s", buf.Bytes(), want)
+			}
+		})
+	}
+}
+
+func TestWriteSourceDataFile_ReplacesExisting(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "test_source.json")
+	if err := os.WriteFile(path, []byte("stale"), 0600); err != nil {
+		t.Fatalf("seed: %v", err)
+	}
+
+	sourceData := &SourceData{
+		SourceInfo: SourceInfo{Name: "Test Source", TotalFonts: 1},
+		Fonts:      map[string]Font{"roboto": {Name: "Roboto"}},
+	}
+	if err := writeSourceDataFile(path, sourceData); err != nil {
+		t.Fatalf("writeSourceDataFile: %v", err)
+	}
+
+	got, err := readSourceDataFile(path)
+	if err != nil {
+		t.Fatalf("readSourceDataFile: %v", err)
+	}
+	if got.SourceInfo.Name != "Test Source" || got.Fonts["roboto"].Name != "Roboto" {
+		t.Fatalf("round trip mismatch: %+v", got)
+	}
+
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		t.Fatalf("ReadDir: %v", err)
+	}
+	if len(entries) != 1 {
+		t.Fatalf("expected only the cache file, found %d entries", len(entries))
+	}
+}
+
+func TestWriteSourceDataFile_RemovesStaleTempFiles(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "test_source.json")
+
+	stale := path + ".tmp-111"
+	fresh := path + ".tmp-222"
+	for _, p := range []string{stale, fresh} {
+		if err := os.WriteFile(p, []byte("{"), 0600); err != nil {
+			t.Fatalf("seed: %v", err)
+		}
+	}
+	old := time.Now().Add(-2 * staleTempFileAge)
+	if err := os.Chtimes(stale, old, old); err != nil {
+		t.Fatalf("chtimes: %v", err)
+	}
+
+	sourceData := &SourceData{SourceInfo: SourceInfo{Name: "Test Source"}}
+	if err := writeSourceDataFile(path, sourceData); err != nil {
+		t.Fatalf("writeSourceDataFile: %v", err)
+	}
+
+	if _, err := os.Stat(stale); !os.IsNotExist(err) {
+		t.Errorf("stale temp file should be removed, stat err = %v", err)
+	}
+	if _, err := os.Stat(fresh); err != nil {
+		t.Errorf("recent temp file should be kept: %v", err)
+	}
+}
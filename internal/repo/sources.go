@@ -1,18 +1,21 @@
 package repo
 
 import (
-	"encoding/json"
 	"fmt"
+	"io"
+	"math/rand"
 	"net/http"
 	"os"
 	"path/filepath"
 	"sort"
 	"strings"
+	"sync"
 	"time"
 
 	"fontget/internal/config"
 	"fontget/internal/logging"
 	"fontget/internal/network"
+	"fontget/internal/output"
 	"fontget/internal/sources"
 	"fontget/internal/ui"
 )
@@ -60,6 +63,9 @@ func DefaultSearchConfig() SearchConfig {
 	}
 }
 
+// searchConfig is the scoring configuration used by search, built once rather than per scored font
+var searchConfig = DefaultSearchConfig()
+
 // Source priority order for consistent sorting across all commands
 // Lower numbers = higher priority
 var sourcePriority = map[string]int{
@@ -130,7 +136,60 @@ func sanitizeSourceNameForFilename(sourceName string) string {
 	return sanitized
 }
 
-func loadSourceDataWithCache(url string, sourceName string, progress ProgressCallback, forceRefresh bool) (*SourceData, error) {
+// newSourceDownloadClient returns the HTTP client shared by all source downloads in one manifest load.
+// Sources are served from the same host, so a shared transport reuses keep-alive connections
+// instead of dialing (and TLS handshaking) once per source.
+func newSourceDownloadClient() *http.Client {
+	// Don't use Timeout for downloads
+	// ResponseHeaderTimeout detects connection issues early
+	// Stall detector handles inactivity detection (no overall timeout needed)
+	appConfig := config.GetUserPreferences()
+	downloadTimeout := config.ParseDuration(appConfig.Network.DownloadTimeout, 30*time.Second)
+	requestTimeout := config.ParseDuration(appConfig.Network.RequestTimeout, 10*time.Second)
+	if requestTimeout < downloadTimeout {
+		requestTimeout = downloadTimeout
+	}
+	if requestTimeout < 30*time.Second {
+		requestTimeout = 30 * time.Second
+	}
+
+	return &http.Client{
+		Transport: network.NewSourceTransport(requestTimeout), // Detect connection/header issues early (configurable)
+		// NO Timeout field - let stall detector handle it
+	}
+}
+
+// getSourceWithRetry issues a GET for a source URL, retrying transient upstream statuses
+// (see network.ShouldRetryGoDownloadStatus) with jittered exponential backoff.
+func getSourceWithRetry(client *http.Client, url string) (*http.Response, error) {
+	const maxTransientAttempts = 3
+	backoff := 150 * time.Millisecond
+
+	// #nosec G404 -- non-cryptographic jitter for HTTP retry backoff only (not security-sensitive).
+	rng := rand.New(rand.NewSource(time.Now().UnixNano()))
+
+	for attempt := 1; ; attempt++ {
+		resp, err := client.Get(url)
+		if err != nil {
+			return nil, err
+		}
+		if !network.ShouldRetryGoDownloadStatus(resp.StatusCode) || attempt == maxTransientAttempts {
+			return resp, nil
+		}
+
+		// Drain so the connection can be reused for the retry
+		_, _ = io.Copy(io.Discard, resp.Body)
+		_ = resp.Body.Close()
+		output.GetDebug().State("getSourceWithRetry: transient HTTP %d from %s, retrying (attempt %d/%d) hdr=%s", resp.StatusCode, url, attempt, maxTransientAttempts, network.FormatHTTPHeadersForDebug(resp.Header))
+		j := time.Duration(rng.Intn(120)) * time.Millisecond
+		time.Sleep(backoff + j)
+		backoff *= 2
+	}
+}
+
+// loadSourceDataWithCache loads a source from cache when the cached copy is fresh relative to now,
+// downloading and caching it otherwise
+func loadSourceDataWithCache(client *http.Client, now time.Time, url string, sourceName string, progress ProgressCallback, forceRefresh bool) (*SourceData, error) {
 	if progress != nil {
 		progress(0, 1, fmt.Sprintf("Loading %s source...", sourceName))
 	}
@@ -153,7 +212,7 @@ func loadSourceDataWithCache(url string, sourceName string, progress ProgressCal
 	if !forceRefresh {
 		if info, err := os.Stat(cacheFile); err == nil {
 			// Check if cache is less than 24 hours old
-			if time.Since(info.ModTime()) < updateInterval {
+			if now.Sub(info.ModTime()) < updateInterval {
 				useCache = true
 			}
 		}
@@ -165,14 +224,11 @@ func loadSourceDataWithCache(url string, sourceName string, progress ProgressCal
 			progress(0, 1, fmt.Sprintf("Loading %s from cache...", sourceName))
 		}
 
-		if data, err := os.ReadFile(cacheFile); err == nil {
-			var sourceData SourceData
-			if err := json.Unmarshal(data, &sourceData); err == nil {
-				if progress != nil {
-					progress(1, 1, fmt.Sprintf("Loaded %s from cache (%d fonts)", sourceName, sourceData.SourceInfo.TotalFonts))
-				}
-				return &sourceData, nil
+		if sourceData, err := readSourceDataFile(cacheFile); err == nil {
+			if progress != nil {
+				progress(1, 1, fmt.Sprintf("Loaded %s from cache (%d fonts)", sourceName, sourceData.SourceInfo.TotalFonts))
 			}
+			return sourceData, nil
 		}
 	}
 
@@ -181,27 +237,10 @@ func loadSourceDataWithCache(url string, sourceName string, progress ProgressCal
 		progress(0, 1, fmt.Sprintf("Downloading %s source...", sourceName))
 	}
 
-	// Create HTTP client - don't use Timeout for downloads
-	// ResponseHeaderTimeout detects connection issues early
-	// Stall detector handles inactivity detection (no overall timeout needed)
 	appConfig := config.GetUserPreferences()
 	downloadTimeout := config.ParseDuration(appConfig.Network.DownloadTimeout, 30*time.Second)
-	requestTimeout := config.ParseDuration(appConfig.Network.RequestTimeout, 10*time.Second)
-	if requestTimeout < downloadTimeout {
-		requestTimeout = downloadTimeout
-	}
-	if requestTimeout < 30*time.Second {
-		requestTimeout = 30 * time.Second
-	}
 
-	transport := &http.Transport{
-		ResponseHeaderTimeout: requestTimeout, // Detect connection/header issues early (configurable)
-	}
-	client := &http.Client{
-		Transport: transport,
-		// NO Timeout field - let stall detector handle it
-	}
-	resp, err := client.Get(url)
+	resp, err := getSourceWithRetry(client, url)
 	if err != nil {
 		return nil, fmt.Errorf("failed to download %s source: %w", sourceName, err)
 	}
@@ -217,19 +256,18 @@ func loadSourceDataWithCache(url string, sourceName string, progress ProgressCal
 	stallReader := network.WrapReaderWithStallDetection(resp.Body, downloadTimeout, 0)
 	defer stallReader.Close()
 
-	var sourceData SourceData
-	if err := json.NewDecoder(stallReader).Decode(&sourceData); err != nil {
+	sourceData, err := decodeSourceData(stallReader)
+	if err != nil {
 		return nil, fmt.Errorf("error parsing %s source: %w", sourceName, err)
 	}
 
-	// Save to cache
-	if data, err := json.MarshalIndent(sourceData, "", "  "); err == nil {
-		if werr := os.WriteFile(cacheFile, data, 0600); werr != nil {
-			if log := logging.GetLogger(); log != nil {
-				log.Warn("failed to write sources cache %q: %v", cacheFile, werr)
-			} else {
-				fmt.Fprintf(os.Stderr, "fontget: warning: failed to write sources cache %q: %v\n", cacheFile, werr)
-			}
+	// Save to cache (compact encoding: the cache is only read back by fontget, and
+	// indenting tens of thousands of font entries roughly doubles encode time and file size)
+	if werr := writeSourceDataFile(cacheFile, sourceData); werr != nil {
+		if log := logging.GetLogger(); log != nil {
+			log.Warn("failed to write sources cache %q: %v", cacheFile, werr)
+		} else {
+			fmt.Fprintf(os.Stderr, "fontget: warning: failed to write sources cache %q: %v\n", cacheFile, werr)
 		}
 	}
 
@@ -237,7 +275,7 @@ func loadSourceDataWithCache(url string, sourceName string, progress ProgressCal
 		progress(1, 1, fmt.Sprintf("Downloaded and cached %s source (%d fonts)", sourceName, sourceData.SourceInfo.TotalFonts))
 	}
 
-	return &sourceData, nil
+	return sourceData, nil
 }
 
 // loadSourceDataFromCacheOnly loads source data from cache only (no refresh)
@@ -258,104 +296,123 @@ func loadSourceDataFromCacheOnly(_ string, sourceName string) (*SourceData, erro
 	}
 
 	// Read from cache
-	data, err := os.ReadFile(cacheFile)
+	sourceData, err := readSourceDataFile(cacheFile)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read cache file: %w", err)
 	}
 
-	var sourceData SourceData
-	if err := json.Unmarshal(data, &sourceData); err != nil {
-		return nil, fmt.Errorf("failed to unmarshal cache data: %w", err)
+	return sourceData, nil
+}
+
+// buildSourceInfo converts a FontGet-Sources document into the legacy SourceInfo form used by
+// FontManifest, with every font ID qualified by the source prefix
+func buildSourceInfo(sourceData *SourceData, prefix string) SourceInfo {
+	sourceInfo := sourceData.SourceInfo
+	sourceInfo.Fonts = make(map[string]FontInfo, len(sourceData.Fonts))
+
+	// Add fonts with source prefix, converting FontData to FontInfo
+	idPrefix := prefix + "."
+	for fontID, font := range sourceData.Fonts {
+		prefixedID := idPrefix + fontID
+
+		// Convert Font to FontInfo for compatibility
+		fontInfo := FontInfo{
+			Name:        font.Name,
+			License:     font.License,
+			LicenseURL:  font.LicenseURL,
+			Version:     font.Version,
+			Description: font.Description,
+			Categories:  font.Categories,
+			Tags:        font.Tags,
+			Popularity:  font.Popularity,
+			MetadataURL: font.MetadataURL,
+			SourceURL:   font.SourceURL,
+		}
+
+		// Convert variants to legacy format and preserve variant-file mapping.
+		// Fonts without variants keep nil maps rather than allocating empty ones.
+		if len(font.Variants) > 0 {
+			fontInfo.Variants = make([]string, 0, len(font.Variants))
+			fontInfo.VariantFiles = make(map[string]map[string]string, len(font.Variants))
+			fontInfo.Files = make(map[string]string)
+		}
+		for _, variant := range font.Variants {
+			fontInfo.Variants = append(fontInfo.Variants, variant.Name)
+
+			// Store variant-specific files and merge them into main files for backward compatibility
+			variantFiles := make(map[string]string, len(variant.Files))
+			for fileType, url := range variant.Files {
+				variantFiles[fileType] = url
+				fontInfo.Files[fileType] = url
+			}
+			fontInfo.VariantFiles[variant.Name] = variantFiles
+		}
+
+		sourceInfo.Fonts[prefixedID] = fontInfo
 	}
 
-	return &sourceData, nil
+	return sourceInfo
 }
 
 // loadAllSourcesFromCacheOnly loads all enabled sources from cache only (no refresh)
 func loadAllSourcesFromCacheOnly(manifest *config.Manifest) (*FontManifest, error) {
 	var allSources = make(map[string]SourceInfo)
 
-	totalSources := 0
-	enabledSources := 0
+	type cachedSource struct {
+		name        string
+		config      config.SourceConfig
+		info        SourceInfo
+		lastUpdated time.Time
+		loaded      bool
+	}
 
-	// Count enabled sources
-	for _, source := range manifest.Sources {
-		if source.Enabled {
-			totalSources++
+	// Collect enabled sources
+	enabled := make([]cachedSource, 0, len(manifest.Sources))
+	for sourceName, sourceConfig := range manifest.Sources {
+		if sourceConfig.Enabled {
+			enabled = append(enabled, cachedSource{name: sourceName, config: sourceConfig})
 		}
 	}
 
-	if totalSources == 0 {
+	if len(enabled) == 0 {
 		return nil, fmt.Errorf("no sources are enabled")
 	}
 
+	// Decode and convert cache files in parallel: JSON parsing dominates load time and each
+	// source is independent. Each goroutine writes only its own slot and keeps just the converted
+	// SourceInfo, so a decoded SourceData can be collected as soon as it is converted.
+	var wg sync.WaitGroup
+	for i := range enabled {
+		wg.Add(1)
+		go func(src *cachedSource) {
+			defer wg.Done()
+			sourceData, err := loadSourceDataFromCacheOnly(src.config.URL, src.name)
+			if err != nil {
+				// Cache not available: the source is skipped below
+				return
+			}
+			src.info = buildSourceInfo(sourceData, src.config.Prefix)
+			src.lastUpdated = sourceData.SourceInfo.LastUpdated
+			src.loaded = true
+		}(&enabled[i])
+	}
+	wg.Wait()
+
+	enabledSources := 0
 	var oldestSourceTime time.Time
 	firstSource := true
 
-	for sourceName, sourceConfig := range manifest.Sources {
-		if !sourceConfig.Enabled {
+	for i := range enabled {
+		src := &enabled[i]
+		if !src.loaded {
 			continue
 		}
 
-		// Use the URL from the configuration
-		sourceURL := sourceConfig.URL
-
-		sourceData, err := loadSourceDataFromCacheOnly(sourceURL, sourceName)
-		if err != nil {
-			// If cache is not available, skip this source
-			continue
-		}
-
-		// Add source info with fonts
-		sourceInfo := sourceData.SourceInfo
-		sourceInfo.Fonts = make(map[string]FontInfo)
-
-		// Add fonts with source prefix, converting FontData to FontInfo
-		for fontID, font := range sourceData.Fonts {
-			prefixedID := fmt.Sprintf("%s.%s", sourceConfig.Prefix, fontID)
-
-			// Convert Font to FontInfo for compatibility
-			fontInfo := FontInfo{
-				Name:        font.Name,
-				License:     font.License,
-				LicenseURL:  font.LicenseURL,
-				Version:     font.Version,
-				Description: font.Description,
-				Categories:  font.Categories,
-				Tags:        font.Tags,
-				Popularity:  font.Popularity,
-				MetadataURL: font.MetadataURL,
-				SourceURL:   font.SourceURL,
-			}
-
-			// Convert variants to legacy format and preserve variant-file mapping
-			fontInfo.VariantFiles = make(map[string]map[string]string)
-			for _, variant := range font.Variants {
-				fontInfo.Variants = append(fontInfo.Variants, variant.Name)
-
-				// Store variant-specific files
-				fontInfo.VariantFiles[variant.Name] = make(map[string]string)
-				for fileType, url := range variant.Files {
-					fontInfo.VariantFiles[variant.Name][fileType] = url
-				}
-
-				// Merge variant files into main files for backward compatibility
-				if fontInfo.Files == nil {
-					fontInfo.Files = make(map[string]string)
-				}
-				for fileType, url := range variant.Files {
-					fontInfo.Files[fileType] = url
-				}
-			}
-
-			sourceInfo.Fonts[prefixedID] = fontInfo
-		}
-
-		allSources[sourceName] = sourceInfo
+		allSources[src.name] = src.info
 		enabledSources++
 
 		// Track the oldest source LastUpdated timestamp
-		sourceTime := sourceData.SourceInfo.LastUpdated
+		sourceTime := src.lastUpdated
 		if firstSource || sourceTime.Before(oldestSourceTime) {
 			oldestSourceTime = sourceTime
 			firstSource = false
@@ -400,6 +457,13 @@ func loadAllSourcesWithCache(manifest *config.Manifest, progress ProgressCallbac
 		return nil, fmt.Errorf("no sources are enabled")
 	}
 
+	client := newSourceDownloadClient()
+	defer client.CloseIdleConnections()
+
+	// One reference time for the whole load: every source's cache freshness is judged against
+	// the same instant, and the manifest is stamped with it
+	now := time.Now()
+
 	currentSource := 0
 	for sourceName, sourceConfig := range manifest.Sources {
 		if !sourceConfig.Enabled {
@@ -414,7 +478,7 @@ func loadAllSourcesWithCache(manifest *config.Manifest, progress ProgressCallbac
 		// Use the URL from the configuration
 		sourceURL := sourceConfig.URL
 
-		sourceData, err := loadSourceDataWithCache(sourceURL, sourceName, nil, forceRefresh)
+		sourceData, err := loadSourceDataWithCache(client, now, sourceURL, sourceName, nil, forceRefresh)
 		if err != nil {
 			// Log the error but continue with other sources
 			if progress != nil {
@@ -423,52 +487,7 @@ func loadAllSourcesWithCache(manifest *config.Manifest, progress ProgressCallbac
 			continue // Skip this source and continue with others
 		}
 
-		// Add source info with fonts
-		sourceInfo := sourceData.SourceInfo
-		sourceInfo.Fonts = make(map[string]FontInfo)
-
-		// Add fonts with source prefix, converting FontData to FontInfo
-		for fontID, font := range sourceData.Fonts {
-			prefixedID := fmt.Sprintf("%s.%s", sourceConfig.Prefix, fontID)
-
-			// Convert Font to FontInfo for compatibility
-			fontInfo := FontInfo{
-				Name:        font.Name,
-				License:     font.License,
-				LicenseURL:  font.LicenseURL,
-				Version:     font.Version,
-				Description: font.Description,
-				Categories:  font.Categories,
-				Tags:        font.Tags,
-				Popularity:  font.Popularity,
-				MetadataURL: font.MetadataURL,
-				SourceURL:   font.SourceURL,
-			}
-
-			// Convert variants to legacy format and preserve variant-file mapping
-			fontInfo.VariantFiles = make(map[string]map[string]string)
-			for _, variant := range font.Variants {
-				fontInfo.Variants = append(fontInfo.Variants, variant.Name)
-
-				// Store variant-specific files
-				fontInfo.VariantFiles[variant.Name] = make(map[string]string)
-				for fileType, url := range variant.Files {
-					fontInfo.VariantFiles[variant.Name][fileType] = url
-				}
-
-				// Merge variant files into main files for backward compatibility
-				if fontInfo.Files == nil {
-					fontInfo.Files = make(map[string]string)
-				}
-				for fileType, url := range variant.Files {
-					fontInfo.Files[fileType] = url
-				}
-			}
-
-			sourceInfo.Fonts[prefixedID] = fontInfo
-		}
-
-		allSources[sourceName] = sourceInfo
+		allSources[sourceName] = buildSourceInfo(sourceData, sourceConfig.Prefix)
 		enabledSources++
 	}
 
@@ -484,7 +503,7 @@ func loadAllSourcesWithCache(manifest *config.Manifest, progress ProgressCallbac
 	// Create combined font manifest
 	fontManifest := &FontManifest{
 		Version:     "2.0", // New version for FontGet-Sources integration
-		LastUpdated: time.Now(),
+		LastUpdated: now,
 		Sources:     allSources,
 	}
 
@@ -498,6 +517,47 @@ type ProgressCallback func(current, total int, message string)
 type Repository struct {
 	manifest                *FontManifest
 	useConfiguredSearchSort bool
+
+	// searchIndex caches lowercased names/IDs for query scoring; built once on first search
+	searchIndexOnce sync.Once
+	searchIndex     []searchEntry
+}
+
+// searchEntry is one manifest font with its lowercased name and ID precomputed
+type searchEntry struct {
+	sourceID   string
+	sourceName string
+	id         string
+	nameLower  string
+	idLower    string
+	font       FontInfo
+}
+
+// searchEntries returns the flattened, lowercased search index for the manifest.
+// Commands like remove and browse search the same Repository many times; building this once
+// avoids re-lowercasing every font name and ID on every query.
+func (r *Repository) searchEntries() []searchEntry {
+	r.searchIndexOnce.Do(func() {
+		n := 0
+		for _, source := range r.manifest.Sources {
+			n += len(source.Fonts)
+		}
+		entries := make([]searchEntry, 0, n)
+		for sourceID, source := range r.manifest.Sources {
+			for id, font := range source.Fonts {
+				entries = append(entries, searchEntry{
+					sourceID:   sourceID,
+					sourceName: source.Name,
+					id:         id,
+					nameLower:  strings.ToLower(font.Name),
+					idLower:    strings.ToLower(id),
+					font:       font,
+				})
+			}
+		}
+		r.searchIndex = entries
+	})
+	return r.searchIndex
 }
 
 // GetRepository returns a new Repository instance, showing spinner if sources need updating
@@ -654,6 +714,7 @@ func (r *Repository) SearchFontsWithOptions(query string, category string) ([]Se
 	// If query is empty but category is provided, return all fonts (will be filtered by category later)
 	if query == "" {
 		// Return all fonts from all sources
+		results = make([]SearchResult, 0, r.TotalManifestFonts())
 		for sourceID, source := range r.manifest.Sources {
 			for id, font := range source.Fonts {
 				result := r.createSearchResult(id, font, sourceID, source.Name)
@@ -665,21 +726,16 @@ func (r *Repository) SearchFontsWithOptions(query string, category string) ([]Se
 	} else {
 		// Normal search with query
 		query = strings.ToLower(query)
-		// Search through each source in the repository's manifest using advanced scoring
-		for sourceID, source := range r.manifest.Sources {
-			for id, font := range source.Fonts {
-				// Check both the font name and ID
-				fontName := strings.ToLower(font.Name)
-				fontID := strings.ToLower(id)
-
-				// Use the advanced scoring algorithm (popularity controlled by global variable)
-				score, matchType := r.calculateMatchScoreWithOptions(query, fontName, fontID, font)
-				if score > 0 {
-					result := r.createSearchResult(id, font, sourceID, source.Name)
-					result.Score = score
-					result.MatchType = matchType
-					results = append(results, result)
-				}
+		// Search through each font in the repository's manifest using advanced scoring
+		for _, entry := range r.searchEntries() {
+			// Check both the font name and ID (lowercased once in the search index)
+			// Use the advanced scoring algorithm (popularity controlled by global variable)
+			score, matchType := r.calculateMatchScoreWithOptions(query, entry.nameLower, entry.idLower, entry.font)
+			if score > 0 {
+				result := r.createSearchResult(entry.id, entry.font, entry.sourceID, entry.sourceName)
+				result.Score = score
+				result.MatchType = matchType
+				results = append(results, result)
 			}
 		}
 		// Sort by score (highest first) only when we have a query
@@ -704,7 +760,7 @@ func (r *Repository) ListCatalogFonts(category string, useSearchSortSettings boo
 	if r != nil {
 		r.useConfiguredSearchSort = readSearchSortFromConfig()
 	}
-	var results []SearchResult
+	results := make([]SearchResult, 0, r.TotalManifestFonts())
 	for sourceID, source := range r.manifest.Sources {
 		for id, font := range source.Fonts {
 			result := r.createSearchResult(id, font, sourceID, source.Name)
@@ -724,45 +780,43 @@ func (r *Repository) ListCatalogFonts(category string, useSearchSortSettings boo
 // using the new configurable algorithm with base score, source priority, and match bonuses
 // Returns both the score and the match type for debugging
 func (r *Repository) calculateMatchScoreWithOptions(query, fontName, fontID string, font FontInfo) (int, string) {
-	config := DefaultSearchConfig()
-
 	// Phase 1: Base Score only (source priority applied in sorting logic)
-	score := config.BaseScore
+	score := searchConfig.BaseScore
 	matchType := "no-match"
 
 	// Phase 2: Match Quality Bonuses
 	if fontName == query {
-		score += config.MatchBonuses.ExactMatch
+		score += searchConfig.MatchBonuses.ExactMatch
 		matchType = "exact"
 	} else if strings.HasPrefix(fontName, query) {
-		score += config.MatchBonuses.PrefixMatch
+		score += searchConfig.MatchBonuses.PrefixMatch
 		matchType = "prefix"
 	} else if strings.Contains(fontName, query) {
 		// Only apply contains match if query is substantial (3+ chars)
 		if len(query) >= 3 {
-			score += config.MatchBonuses.ContainsMatch
+			score += searchConfig.MatchBonuses.ContainsMatch
 			matchType = "contains"
 		}
 	} else if strings.HasPrefix(fontID, query) {
-		score += config.MatchBonuses.IDPrefixMatch
+		score += searchConfig.MatchBonuses.IDPrefixMatch
 		matchType = "id-prefix"
 	} else if strings.Contains(fontID, query) {
 		// Only apply ID contains match if query is substantial (4+ chars)
 		if len(query) >= 4 {
-			score += config.MatchBonuses.IDContainsMatch
+			score += searchConfig.MatchBonuses.IDContainsMatch
 			matchType = "id-contains"
 		}
 	}
 
 	// If no match found, return 0
-	if score == config.BaseScore {
+	if score == searchConfig.BaseScore {
 		return 0, "no-match"
 	}
 
 	// Phase 3: Popularity - only if enabled and font has popularity
 	if r != nil && r.useConfiguredSearchSort && font.Popularity > 0 {
 		// Apply full popularity bonus (no length adjustment here)
-		popularityBonus := float64(font.Popularity) / float64(config.PopularityDivisor)
+		popularityBonus := float64(font.Popularity) / float64(searchConfig.PopularityDivisor)
 		score += int(popularityBonus)
 	}
 
@@ -0,0 +1,110 @@
+package repo
+
+import (
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"reflect"
+	"sync/atomic"
+	"testing"
+)
+
+func TestBuildSourceInfo(t *testing.T) {
+	sourceData := &SourceData{
+		SourceInfo: SourceInfo{Name: "Test Source", TotalFonts: 2},
+		Fonts: map[string]Font{
+			"roboto": {
+				Name:    "Roboto",
+				License: "OFL",
+				Variants: []FontVariant{
+					{Name: "regular", Files: map[string]string{"ttf": "https://example.com/r.ttf"}},
+					{Name: "bold", Files: map[string]string{"woff2": "https://example.com/b.woff2"}},
+				},
+			},
+			"plain": {Name: "Plain"},
+		},
+	}
+
+	got := buildSourceInfo(sourceData, "test")
+
+	if got.Name != "Test Source" || got.TotalFonts != 2 {
+		t.Fatalf("source info header not preserved: %+v", got)
+	}
+	if len(got.Fonts) != 2 {
+		t.Fatalf("expected 2 fonts, got %d", len(got.Fonts))
+	}
+
+	roboto, ok := got.Fonts["test.roboto"]
+	if !ok {
+		t.Fatalf("expected prefixed ID test.roboto, got %v", got.Fonts)
+	}
+	if !reflect.DeepEqual(roboto.Variants, []string{"regular", "bold"}) {
+		t.Errorf("variants: got %v", roboto.Variants)
+	}
+	wantFiles := map[string]string{"ttf": "https://example.com/r.ttf", "woff2": "https://example.com/b.woff2"}
+	if !reflect.DeepEqual(roboto.Files, wantFiles) {
+		t.Errorf("files: got %v, want %v", roboto.Files, wantFiles)
+	}
+	if roboto.VariantFiles["bold"]["woff2"] != "https://example.com/b.woff2" {
+		t.Errorf("variant files: got %v", roboto.VariantFiles)
+	}
+
+	plain := got.Fonts["test.plain"]
+	if plain.Name != "Plain" || plain.Variants != nil || plain.VariantFiles != nil || plain.Files != nil {
+		t.Errorf("font without variants: got %+v", plain)
+	}
+}
+
+func TestGetSourceWithRetry_RecoversFromTransientStatus(t *testing.T) {
+	var calls atomic.Int32
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+		if calls.Add(1) == 1 {
+			w.WriteHeader(http.StatusServiceUnavailable)
+			return
+		}
+		_, _ = io.WriteString(w, `{"fonts":{}}`)
+	}))
+	defer srv.Close()
+
+	resp, err := getSourceWithRetry(srv.Client(), srv.URL)
+	if err != nil {
+		t.Fatalf("getSourceWithRetry: %v", err)
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode != http.StatusOK {
+		t.Fatalf("status: got %d, want %d", resp.StatusCode, http.StatusOK)
+	}
+	body, err := io.ReadAll(resp.Body)
+	if err != nil {
+		t.Fatalf("read body: %v", err)
+	}
+	if string(body) != `{"fonts":{}}` {
+		t.Errorf("body: got %q", body)
+	}
+	if got := calls.Load(); got != 2 {
+		t.Errorf("attempts: got %d, want 2", got)
+	}
+}
+
+func TestGetSourceWithRetry_GivesUpAfterMaxAttempts(t *testing.T) {
+	var calls atomic.Int32
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+		calls.Add(1)
+		w.WriteHeader(http.StatusServiceUnavailable)
+	}))
+	defer srv.Close()
+
+	resp, err := getSourceWithRetry(srv.Client(), srv.URL)
+	if err != nil {
+		t.Fatalf("getSourceWithRetry: %v", err)
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode != http.StatusServiceUnavailable {
+		t.Fatalf("status: got %d, want %d", resp.StatusCode, http.StatusServiceUnavailable)
+	}
+	if got := calls.Load(); got != 3 {
+		t.Errorf("attempts: got %d, want 3", got)
+	}
+}
@@ -4,6 +4,7 @@ import (
 	"fmt"
 	"strings"
 
+	"fontget/internal/normalize"
 	"fontget/internal/repo"
 )
 
@@ -24,9 +25,7 @@ func FindSimilarFonts(fontName string, allFonts []string, isInstalledFonts bool)
 	if isInstalledFonts {
 		// For installed fonts, use simpler matching for speed
 		queryLower := strings.ToLower(fontName)
-		queryNorm := strings.ReplaceAll(queryLower, " ", "")
-		queryNorm = strings.ReplaceAll(queryNorm, "-", "")
-		queryNorm = strings.ReplaceAll(queryNorm, "_", "")
+		queryNorm := normalize.FontKey(fontName)
 
 		var similar []string
 		seen := make(map[string]bool)
@@ -40,9 +39,7 @@ func FindSimilarFonts(fontName string, allFonts []string, isInstalledFonts bool)
 	if err != nil {
 		// Fallback to simple matching if sophisticated scoring fails
 		queryLower := strings.ToLower(fontName)
-		queryNorm := strings.ReplaceAll(queryLower, " ", "")
-		queryNorm = strings.ReplaceAll(queryNorm, "-", "")
-		queryNorm = strings.ReplaceAll(queryNorm, "_", "")
+		queryNorm := normalize.FontKey(fontName)
 
 		var fallbackSimilar []string
 
@@ -107,16 +104,19 @@ func findSimilarFontsWithScoring(fontName string, _ bool) ([]string, error) {
 func findMatchesInInstalledFonts(queryLower, queryNorm string, fontList []string, existing []string, seen map[string]bool, maxResults int) []string {
 	similar := existing
 
+	// Lowercased names are kept for the word pass below, which only runs when this pass
+	// visited every font
+	fontLowers := make([]string, len(fontList))
+
 	// Simple substring matching for speed
-	for _, font := range fontList {
+	for i, font := range fontList {
 		if len(similar) >= maxResults {
 			break
 		}
 
 		fontLower := strings.ToLower(font)
-		fontNorm := strings.ReplaceAll(fontLower, " ", "")
-		fontNorm = strings.ReplaceAll(fontNorm, "-", "")
-		fontNorm = strings.ReplaceAll(fontNorm, "_", "")
+		fontLowers[i] = fontLower
+		fontNorm := normalize.FontKey(font)
 
 		// Skip exact equals and already found fonts
 		if fontLower == queryLower || fontNorm == queryNorm || seen[font] {
@@ -131,15 +131,24 @@ func findMatchesInInstalledFonts(queryLower, queryNorm string, fontList []string
 
 	// If no substring matches and we still need more, try partial word matches
 	if len(similar) < maxResults {
-		words := strings.Fields(queryLower)
-		for _, font := range fontList {
+		// Tokenize the query once; words of 2 chars or fewer never match
+		var words []string
+		for _, word := range strings.Fields(queryLower) {
+			if len(word) > 2 {
+				words = append(words, word)
+			}
+		}
+		if len(words) == 0 {
+			return similar
+		}
+
+		for i, font := range fontList {
 			if len(similar) >= maxResults || seen[font] {
 				break
 			}
 
-			fontLower := strings.ToLower(font)
 			for _, word := range words {
-				if len(word) > 2 && strings.Contains(fontLower, word) {
+				if strings.Contains(fontLowers[i], word) {
 					similar = append(similar, font)
 					seen[font] = true
 					break
@@ -0,0 +1,28 @@
+package shared
+
+import (
+	"reflect"
+	"testing"
+)
+
+func TestFindSimilarFonts_InstalledFonts(t *testing.T) {
+	installed := []string{"Roboto", "Roboto Mono", "Fira Code", "Open Sans", "Source Code Pro"}
+
+	tests := []struct {
+		name  string
+		query string
+		want  []string
+	}{
+		{name: "substring match", query: "mono", want: []string{"Roboto Mono"}},
+		{name: "word match when no substring match", query: "code editor", want: []string{"Fira Code", "Source Code Pro"}},
+		{name: "short words are ignored", query: "xy ab", want: nil},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := FindSimilarFonts(tt.query, installed, true)
+			if !reflect.DeepEqual(got, tt.want) {
+				t.Fatalf("FindSimilarFonts(%q) = %v, want %v", tt.query, got, tt.want)
+			}
+		})
+	}
+}
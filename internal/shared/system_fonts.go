@@ -2,7 +2,8 @@ package shared
 
 import (
 	"runtime"
-	"strings"
+
+	"fontget/internal/normalize"
 )
 
 // windowsSystemFonts is a list of critical Windows system fonts
@@ -265,11 +266,7 @@ var linuxSystemFonts = map[string]bool{
 // normalizeFontNameForCheck normalizes a font name for comparison
 // (lowercase, removes spaces/hyphens/underscores)
 func normalizeFontNameForCheck(fontName string) string {
-	name := strings.ToLower(fontName)
-	name = strings.ReplaceAll(name, " ", "")
-	name = strings.ReplaceAll(name, "-", "")
-	name = strings.ReplaceAll(name, "_", "")
-	return name
+	return normalize.FontKey(fontName)
 }
 
 // IsCriticalSystemFont checks if a font is a critical system font for any platform.